@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+
+from tvl.configuration_file_model import load_configuration_file
+
+_CONFIGURATION_FILE = Path(__file__).parents[1] / "examples" / "conf.yml"
+
+
+def test_load_returns_independent_copies():
+    configuration = load_configuration_file(_CONFIGURATION_FILE)
+    configuration["host"]["pairing_key_index"] = -1
+    configuration["model"].clear()
+
+    reloaded = load_configuration_file(_CONFIGURATION_FILE)
+    assert reloaded["host"]["pairing_key_index"] != -1
+    assert reloaded["model"]
+
+
+def test_load_is_refreshed_when_file_is_modified(tmp_path: Path):
+    filename = tmp_path / "conf.yml"
+    filename.write_bytes(_CONFIGURATION_FILE.read_bytes())
+    assert load_configuration_file(filename)["model"]
+
+    filename.write_text("{}\n")
+    stat = filename.stat()
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_configuration_file(filename) == {"host": {}, "model": {}}
+
+
+def test_load_is_refreshed_when_mtime_is_unchanged(tmp_path: Path):
+    filename = tmp_path / "conf.yml"
+    filename.write_bytes(_CONFIGURATION_FILE.read_bytes())
+    stat = filename.stat()
+    assert load_configuration_file(filename)["model"]
+
+    filename.write_text("{}\n")
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert filename.stat().st_mtime_ns == stat.st_mtime_ns
+    assert load_configuration_file(filename) == {"host": {}, "model": {}}
@@ -1,5 +1,6 @@
+import copy
 import importlib
-from typing import Any, ContextManager, Type, Union
+from typing import Any, ContextManager, List, Type, Union
 
 from tvl.messages import l2_messages
 
@@ -9,7 +10,15 @@ from contextlib import nullcontext
 
 import pytest
 
-from tvl.messages.datafield import AUTO, U16Scalar, U32Array, U64Scalar, datafield
+from tvl.messages.datafield import (
+    AUTO,
+    U8Array,
+    U16Array,
+    U16Scalar,
+    U32Array,
+    U64Scalar,
+    datafield,
+)
 from tvl.messages.exceptions import (
     DataValueError,
     FieldAlreadyExistsError,
@@ -117,6 +126,15 @@ def test_subclasses():
     assert len(RequestTest1.with_data_length((dl := 2))()) == empty_len + dl
 
 
+def test_subclasses_defined_after_lookup():
+    assert not L2Request.find_subclasses(0xFD)
+
+    class RequestTest3(L2Request, id=0xFD):
+        pass
+
+    assert L2Request.find_subclasses(0xFD) == [RequestTest3]
+
+
 def test_message():
     request = RequestTest1()
     assert request.has_valid_id()
@@ -189,3 +207,54 @@ def test_equalities():
     assert (same := RequestTest1(f1=0x99, crc=0x1234)) == same
 
     assert RequestTest1() != "dummy"
+
+
+def test_fields_are_slots():
+    message = RequestTest1()
+    assert not hasattr(message, "__dict__")
+    assert [name for name, _ in message] == ["id", "length", "f1", "f2", "crc"]
+
+
+def test_auto_survives_copy():
+    message = RequestTest1()
+    _message = copy.deepcopy(message)
+    assert _message.crc.value is AUTO
+    assert _message == message
+
+
+def test_params_are_frozen():
+    params = RequestTest1().f2.params
+    assert not hasattr(params, "__dict__")
+    with pytest.raises(AttributeError):
+        params.max_size = 4  # type: ignore
+    assert copy.deepcopy(params) == params
+    assert hash(copy.copy(params)) == hash(params)
+
+
+class HexstrMessage(L2Request, id=0x14):
+    u8: U8Array = datafield(min_size=0, max_size=4)
+    u16: U16Array = datafield(min_size=0, max_size=4)
+
+
+def _legacy_hexstr(values: List[int], nb_chars: int) -> str:
+    return f"[{', '.join(f'{x:0{nb_chars}x}' for x in values)}]"
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param([0x00, 0x0A, 0xFF], id="in_range"),
+        pytest.param([], id="empty"),
+        pytest.param([0x01, 0x100], id="too_large"),
+        pytest.param([-1, 0x02], id="negative"),
+    ],
+)
+def test_u8_array_hexstr(values: List[int]):
+    message = HexstrMessage(u8=values, u16=[])
+    assert message.u8.hexstr() == _legacy_hexstr(values, 2)
+
+
+def test_u16_array_hexstr():
+    values = [0x0001, 0xABCD, 0x10]
+    message = HexstrMessage(u8=[], u16=values)
+    assert message.u16.hexstr() == _legacy_hexstr(values, 4)
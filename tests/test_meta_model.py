@@ -0,0 +1,219 @@
+import logging
+from typing import Union, get_type_hints
+
+import pytest
+
+from tvl.targets.model.meta_model import MetaModel, api, base, tag_api
+
+
+class Request:
+    pass
+
+
+class RequestA(Request):
+    pass
+
+
+class RequestB(Request):
+    pass
+
+
+class RequestC(Request):
+    pass
+
+
+class SubRequestA(RequestA):
+    pass
+
+
+class Model(MetaModel):
+    logger = logging.getLogger("test_meta_model")
+
+    @base("test_api")
+    def process(self, request: Request) -> str:
+        raise NotImplementedError(f"{type(request)} not supported")
+
+    @api("test_api")
+    def process_a(self, request: RequestA) -> str:
+        return "a"
+
+    @api("test_api", (RequestB, RequestC))
+    def process_b_or_c(self, request: Request) -> str:
+        return "b_or_c"
+
+
+class ModelImpl(Model):
+    def process_a(self, request: RequestA) -> str:
+        return "impl_a"
+
+
+class UnionModel(MetaModel):
+    logger = logging.getLogger("test_meta_model")
+
+    @base("test_api")
+    def process(self, request: Request) -> str:
+        return "base"
+
+    @api("test_api")
+    def process_union(self, request: Union[RequestA, RequestB]) -> str:
+        return "union"
+
+
+@pytest.mark.parametrize(
+    "request_, expected",
+    [
+        pytest.param(RequestA(), "a", id="annotated"),
+        pytest.param(RequestB(), "b_or_c", id="explicit_1"),
+        pytest.param(RequestC(), "b_or_c", id="explicit_2"),
+        pytest.param(SubRequestA(), "a", id="subclass"),
+    ],
+)
+def test_dispatch(request_: Request, expected: str):
+    assert Model().process(request_) == expected
+    # second call goes through the memoized lookup
+    assert Model().process(request_) == expected
+
+
+def test_dispatch_to_base():
+    with pytest.raises(NotImplementedError):
+        Model().process(Request())
+
+
+def test_dispatch_to_override():
+    assert ModelImpl().process(RequestA()) == "impl_a"
+    assert ModelImpl().process(RequestB()) == "b_or_c"
+    # the parent class keeps its own overloads
+    assert Model().process(RequestA()) == "a"
+
+
+def test_dispatch_union():
+    assert UnionModel().process(RequestA()) == "union"
+    assert UnionModel().process(RequestB()) == "union"
+    assert UnionModel().process(RequestC()) == "base"
+
+
+def test_override_keeps_decorated_types():
+    class OverrideImpl(Model):
+        # annotated differently from the decorated method
+        def process_a(self, request: RequestB) -> str:
+            return "override_a"
+
+    assert OverrideImpl().process(RequestA()) == "override_a"
+    assert OverrideImpl().process(RequestB()) == "b_or_c"
+
+
+def test_overloads_are_logged(caplog: pytest.LogCaptureFixture):
+    with caplog.at_level(logging.DEBUG, logger="test_meta_model"):
+        ModelImpl().process(RequestA())
+    assert caplog.messages == [
+        f"Executing {ModelImpl.process_a.__qualname__}",
+        f"Done executing {ModelImpl.process_a.__qualname__}",
+    ]
+
+
+def test_overloads_not_logged(caplog: pytest.LogCaptureFixture):
+    class QuietModelImpl(ModelImpl):
+        log_dispatch = False
+
+    with caplog.at_level(logging.DEBUG, logger="test_meta_model"):
+        assert QuietModelImpl().process(RequestA()) == "impl_a"
+    assert not caplog.messages
+
+
+def test_overload_defined_before_base():
+    class Overloads(MetaModel):
+        logger = logging.getLogger("test_meta_model")
+
+        @api("test_api")
+        def process_a(self, request: RequestA) -> str:
+            return "a"
+
+    class WithBase(Overloads):
+        @base("test_api")
+        def process(self, request: Request) -> str:
+            return "base"
+
+    assert WithBase().process(RequestA()) == "a"
+    assert WithBase().process(RequestB()) == "base"
+
+
+def test_overload_in_mixin():
+    class RequestD(Request):
+        pass
+
+    class Mixin:
+        @api("test_api")
+        def process_d(self, request: RequestD) -> str:
+            return "mixin"
+
+    class WithMixin(Model, Mixin):
+        pass
+
+    assert WithMixin().process(RequestD()) == "mixin"
+    assert WithMixin().process(RequestA()) == "a"
+
+
+def test_wrappers_are_shared():
+    class QuietModelImpl(ModelImpl):
+        log_dispatch = False
+
+    class LoudModelImpl1(QuietModelImpl):
+        log_dispatch = True
+
+    class LoudModelImpl2(QuietModelImpl):
+        log_dispatch = True
+
+    assert QuietModelImpl.process_a is not LoudModelImpl1.process_a
+    assert LoudModelImpl1.process_a is LoudModelImpl2.process_a
+
+
+def test_tag_api():
+    def _process_c(self, request: RequestC) -> str:
+        return "tagged"
+
+    class TaggedModel(Model):
+        process_c = tag_api(_process_c, "test_api")
+
+    assert TaggedModel().process(RequestC()) == "tagged"
+    assert TaggedModel().process(RequestA()) == "a"
+
+
+def test_wrapper_introspection():
+    wrapper = ModelImpl.process_a
+    assert wrapper.__module__ == __name__
+    assert wrapper.__qualname__ == "ModelImpl.process_a"
+    assert get_type_hints(wrapper) == {"request": RequestA, "return": str}
+
+
+def test_forward_reference_resolved_on_registration(monkeypatch: pytest.MonkeyPatch):
+    class Mixin:
+        @api("test_api")
+        def process_late(self, request: "LateRequest") -> str:  # noqa: F821
+            return "late"
+
+    class LateRequest(Request):
+        pass
+
+    # resolvable once the module defines it, after the decoration
+    monkeypatch.setitem(globals(), "LateRequest", LateRequest)
+
+    class WithLate(Model, Mixin):
+        # the types are read from the decorated method, not from the override
+        def process_late(self, request: RequestA) -> str:
+            return "late_impl"
+
+    assert WithLate().process(LateRequest()) == "late_impl"
+    assert WithLate().process(RequestA()) == "a"
+
+
+def test_decorated_functions_are_callable():
+    def process_a(self, request: RequestA) -> str:
+        return "a"
+
+    def process(self, request: Request) -> str:
+        return "base"
+
+    assert api("test_api")(process_a)(None, RequestA()) == "a"
+    assert tag_api(process_a, "test_api")(None, RequestA()) == "a"
+    # the base method dispatches through the tables of the instance
+    assert base("test_api")(process)(Model(), RequestA()) == "a"
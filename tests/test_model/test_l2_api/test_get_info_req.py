@@ -1,56 +1,74 @@
-import os
-from typing import Any, Callable, Dict, Iterator
+import random
+from typing import Any, Callable, Dict
 
 import pytest
 
 from tvl.api.l2_api import TsL2GetInfoRequest, TsL2GetInfoResponse
 from tvl.constants import L2StatusEnum
 from tvl.host.host import Host
+from tvl.targets.model.tropic01_model import Tropic01Model
 
-from ..utils import one_of, one_outside
+from ..utils import create_configuration, one_of, one_outside, randbytes
 
-_X509_CERTIFICATE = os.urandom(512)
-_CHIP_ID = os.urandom(128)
-_RISCV_FW_VERSION = os.urandom(4)
-_SPECT_FW_VERSION = os.urandom(4)
+_RNG = random.Random(0x6E7)
 
+_X509_CERTIFICATE = randbytes(_RNG, 512)
+_CHIP_ID = randbytes(_RNG, 128)
+_RISCV_FW_VERSION = randbytes(_RNG, 4)
+_SPECT_FW_VERSION = randbytes(_RNG, 4)
 
-@pytest.fixture()
-def model_configuration(model_configuration: Dict[str, Any]):
-    model_configuration.update(
-        {
+
+# GET_INFO requests do not modify the state of the model:
+# build the model and the host once for the whole module.
+
+
+@pytest.fixture(scope="module")
+def configuration():
+    configuration = create_configuration()
+    yield {
+        "host": configuration["host"],
+        "model": {
+            **configuration["model"],
             "x509_certificate": _X509_CERTIFICATE,
             "chip_id": _CHIP_ID,
             "riscv_fw_version": _RISCV_FW_VERSION,
             "spect_fw_version": _SPECT_FW_VERSION,
-        }
-    )
-    yield model_configuration
+        },
+    }
 
 
-def _valid_block_index() -> Iterator[int]:
-    yield from range(30)
+@pytest.fixture(scope="module")
+def model(configuration: Dict[str, Any]):
+    yield Tropic01Model.from_dict(configuration["model"])
 
 
-def _get_padded_certificate_chunk(block_index: int) -> bytes:
-    chunk = _X509_CERTIFICATE[block_index * 128 : (block_index + 1) * 128]
-    return b"\x00" * (128 - len(chunk)) + chunk
+@pytest.fixture(scope="module")
+def host(model: Tropic01Model, configuration: Dict[str, Any]):
+    with Host.from_dict(configuration["host"]).set_target(model) as _host:
+        yield _host
 
 
-@pytest.mark.parametrize("block_index", _valid_block_index())
-@pytest.mark.parametrize(
-    "object_id, expected_data_fn",
-    [
-        pytest.param(
-            oid := TsL2GetInfoRequest.ObjectIdEnum.X509_CERTIFICATE,
-            _get_padded_certificate_chunk,
-            id=str(oid),
-        ),
-        pytest.param(oid := TsL2GetInfoRequest.ObjectIdEnum.CHIP_ID, lambda x: _CHIP_ID, id=str(oid)),  # type: ignore
-        pytest.param(oid := TsL2GetInfoRequest.ObjectIdEnum.RISCV_FW_VERSION, lambda x: _RISCV_FW_VERSION, id=str(oid)),  # type: ignore
-        pytest.param(oid := TsL2GetInfoRequest.ObjectIdEnum.SPECT_FW_VERSION, lambda x: _SPECT_FW_VERSION, id=str(oid)),  # type: ignore
-    ],
+_VALID_BLOCK_INDICES = tuple(range(30))
+
+_X509_CERTIFICATE_CHUNKS = tuple(
+    _X509_CERTIFICATE[i * 128 : (i + 1) * 128].rjust(128, b"\x00")
+    for i in _VALID_BLOCK_INDICES
 )
+
+_OBJECT_ID_PARAMS = (
+    pytest.param(
+        oid := TsL2GetInfoRequest.ObjectIdEnum.X509_CERTIFICATE,
+        _X509_CERTIFICATE_CHUNKS.__getitem__,
+        id=str(oid),
+    ),
+    pytest.param(oid := TsL2GetInfoRequest.ObjectIdEnum.CHIP_ID, lambda x: _CHIP_ID, id=str(oid)),  # type: ignore
+    pytest.param(oid := TsL2GetInfoRequest.ObjectIdEnum.RISCV_FW_VERSION, lambda x: _RISCV_FW_VERSION, id=str(oid)),  # type: ignore
+    pytest.param(oid := TsL2GetInfoRequest.ObjectIdEnum.SPECT_FW_VERSION, lambda x: _SPECT_FW_VERSION, id=str(oid)),  # type: ignore
+)
+
+
+@pytest.mark.parametrize("block_index", _VALID_BLOCK_INDICES)
+@pytest.mark.parametrize("object_id, expected_data_fn", _OBJECT_ID_PARAMS)
 def test(
     host: Host,
     block_index: int,
@@ -68,7 +86,7 @@ def test(
 def test_invalid_object_id(host: Host):
     request = TsL2GetInfoRequest(
         object_id=one_outside(TsL2GetInfoRequest.ObjectIdEnum),
-        block_index=one_of(_valid_block_index()),
+        block_index=one_of(_VALID_BLOCK_INDICES),
     )
     response = host.send_request(request)
 
@@ -103,7 +121,7 @@ def test_invalid_object_id(host: Host):
 )
 def test_invalid_block_index(host: Host, object_id: int, expected_status: int):
     request = TsL2GetInfoRequest(
-        object_id=object_id, block_index=one_outside(_valid_block_index())
+        object_id=object_id, block_index=one_outside(_VALID_BLOCK_INDICES)
     )
     response = host.send_request(request)
 
@@ -0,0 +1,66 @@
+import pytest
+
+from tvl.api.l2_api import (
+    TsL2EncryptedCmdRequest,
+    TsL2EncryptedCmdResponse,
+    TsL2GetInfoRequest,
+)
+from tvl.constants import ENCRYPTION_TAG_LEN, L2StatusEnum, L3ResultFieldEnum
+from tvl.crypto.hash import crc16
+from tvl.messages.l2_messages import L2Response
+from tvl.messages.l3_messages import L3EncryptedPacket
+from tvl.targets.model.tropic01_model import Tropic01Model
+
+_REQUEST = TsL2GetInfoRequest(
+    object_id=TsL2GetInfoRequest.ObjectIdEnum.CHIP_ID, block_index=0
+).to_bytes()
+
+
+def _process(model: Tropic01Model, data: bytes) -> L2Response:
+    response = model.process_input(data)
+    assert isinstance(response, bytes)
+    return L2Response.with_length(len(response)).from_bytes(response)
+
+
+def test_valid_request(model: Tropic01Model):
+    assert _process(model, _REQUEST).status.value == L2StatusEnum.REQ_OK
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(_REQUEST[:-1] + bytes([_REQUEST[-1] ^ 0xFF]), id="wrong_crc"),
+        pytest.param(bytes([_REQUEST[0] ^ 0x01]) + _REQUEST[1:], id="wrong_id"),
+        pytest.param(b"\x01", id="too_short"),
+    ],
+)
+def test_crc_error(model: Tropic01Model, data: bytes):
+    assert _process(model, data).status.value == L2StatusEnum.CRC_ERR
+
+
+def test_unknown_request(model: Tropic01Model):
+    data = b"\xff" + _REQUEST[1:-2]
+    data += crc16(data).to_bytes(2, "little")
+
+    assert _process(model, data).status.value == L2StatusEnum.UNKNOWN_REQ
+
+
+def test_empty_l3_command(model: Tropic01Model):
+    # without encryption, the decrypted command is the packet minus its tag
+    model.activate_encryption = False
+    packet = L3EncryptedPacket.from_encrypted(bytes(ENCRYPTION_TAG_LEN))
+    request = TsL2EncryptedCmdRequest(l3_chunk=packet.to_bytes())
+
+    responses = model.process_input(request.to_bytes())
+    assert isinstance(responses, list)
+    first, *result_chunks = responses
+    status = L2Response.with_length(len(first)).from_bytes(first).status
+    assert status.value == L2StatusEnum.REQ_OK
+
+    result = L3EncryptedPacket.from_bytes(
+        b"".join(
+            TsL2EncryptedCmdResponse.from_bytes(chunk).data_field_bytes
+            for chunk in result_chunks
+        )
+    )
+    assert result.ciphertext.to_bytes() == bytes([L3ResultFieldEnum.INVALID_CMD])
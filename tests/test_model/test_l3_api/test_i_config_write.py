@@ -1,6 +1,6 @@
 import random
 from itertools import chain
-from typing import Any, Dict, Iterator
+from typing import Any, Dict
 
 import pytest
 
@@ -10,39 +10,37 @@ from tvl.host.host import Host
 from tvl.targets.model.configuration_object_impl import ConfigObjectRegisterAddressEnum
 from tvl.targets.model.tropic01_model import Tropic01Model
 
-from ..utils import UtilsCo
+from ..utils import UtilsCo, one_of
 
 U32_MAX = 2**32 - 1
 
+# seeded so that every collection (e.g. each xdist worker) sees the same values
+_RNG = random.Random(0)
+
 I_CONFIG_CFG = {
     **{
-        register: random.randint(0, U32_MAX)
+        register: _RNG.randint(0, U32_MAX)
         for register in ConfigObjectRegisterAddressEnum
     },
     # ensure that the users have the rights to write all the i-config registers
     ConfigObjectRegisterAddressEnum.CFG_UAP_I_CONFIG_WRITE: 0x0000_FFFF,
 }
 
+_I_CONFIG_MODEL_CFG = {
+    register.name.lower(): value for register, value in I_CONFIG_CFG.items()
+}
 
-def _valid_bit_index() -> Iterator[int]:
-    while True:
-        yield random.randint(0, 31)
 
+_VALID_BIT_RANGE = range(0, 32)
+_INVALID_BIT_RANGE = range(32, 256)
 
-def _invalid_bit_index() -> Iterator[int]:
-    while True:
-        yield random.randint(32, 255)
+_VALID_BIT_INDICES = _RNG.choices(_VALID_BIT_RANGE, k=len(I_CONFIG_CFG))
+_INVALID_BIT_INDICES = _RNG.choices(_INVALID_BIT_RANGE, k=len(I_CONFIG_CFG))
 
 
 @pytest.fixture()
 def model_configuration(model_configuration: Dict[str, Any]):
-    model_configuration.update(
-        {
-            "i_config": {
-                register.name.lower(): value for register, value in I_CONFIG_CFG.items()
-            }
-        }
-    )
+    model_configuration.update({"i_config": dict(_I_CONFIG_MODEL_CFG)})
     yield model_configuration
 
 
@@ -50,7 +48,7 @@ def model_configuration(model_configuration: Dict[str, Any]):
     "register, value, bit_index",
     (
         pytest.param(r, v, bi, id=f"{r!s}-{v:#x}-{bi}")
-        for (r, v), bi in zip(I_CONFIG_CFG.items(), _valid_bit_index())
+        for (r, v), bi in zip(I_CONFIG_CFG.items(), _VALID_BIT_INDICES)
     ),
 )
 def test_valid_bit_index(
@@ -77,7 +75,7 @@ def test_valid_bit_index(
     "register, bit_index",
     (
         pytest.param(r, bi, id=f"{r!s}-{bi}")
-        for r, bi in zip(I_CONFIG_CFG, _invalid_bit_index())
+        for r, bi in zip(I_CONFIG_CFG, _INVALID_BIT_INDICES)
     ),
 )
 def test_invalid_bit_index(
@@ -114,7 +112,7 @@ def test_invalid_bit_index(
 def test_invalid_address(address: int, expected_result: L3ResultFieldEnum, host: Host):
     command = TsL3IConfigWriteCommand(
         address=address,
-        bit_index=next(_valid_bit_index()),
+        bit_index=one_of(_VALID_BIT_RANGE),
     )
     result = host.send_command(command)
 
@@ -1,4 +1,4 @@
-import os
+import random
 from typing import Any, Dict
 
 import pytest
@@ -10,12 +10,14 @@ from tvl.messages.randomize import randomize
 from tvl.targets.model.internal.pairing_keys import KEY_SIZE, SlotState
 from tvl.targets.model.tropic01_model import Tropic01Model
 
-from ..utils import sample_from, sample_outside
+from ..utils import randbytes, sample_from, sample_outside
 
 KEY_SLOTS = sample_from((lst := TsL3PairingKeyWriteCommand.SlotEnum), k=4)
 SECURE_CHANNEL_KEY_IDX, SET_KEY_IDX, BLANK_KEY_IDX, INVALID_KEY_IDX = KEY_SLOTS
 
-SET_KEY = os.urandom(KEY_SIZE)
+_RNG = random.Random(0x5E7)
+
+SET_KEY = randbytes(_RNG, KEY_SIZE)
 
 
 @pytest.fixture()
@@ -38,21 +40,21 @@ def configuration(configuration: Dict[str, Any]):
     [
         pytest.param(
             BLANK_KEY_IDX,
-            (v_ := os.urandom(KEY_SIZE)),
+            (v_ := randbytes(_RNG, KEY_SIZE)),
             L3ResultFieldEnum.OK,
             v_,
             id="blank_slot",
         ),
         pytest.param(
             SET_KEY_IDX,
-            os.urandom(KEY_SIZE),
+            randbytes(_RNG, KEY_SIZE),
             L3ResultFieldEnum.FAIL,
             SET_KEY,
             id="already_set_slot",
         ),
         pytest.param(
             INVALID_KEY_IDX,
-            (v_ := os.urandom(KEY_SIZE)),
+            (v_ := randbytes(_RNG, KEY_SIZE)),
             L3ResultFieldEnum.FAIL,
             b"",
             id="invalid_slot",
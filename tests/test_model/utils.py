@@ -1,9 +1,24 @@
 import os
-from random import getrandbits, randint, randrange, sample
-from typing import Any, Iterable, Iterator, List, Optional, Sequence, TypeVar
+from functools import lru_cache
+from random import Random, getrandbits, randint, randrange, sample
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 import pytest
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
 
+from tvl.configuration_file_model import ConfigurationFileModel
+from tvl.constants import S_HI_PUB_NB_SLOTS
 from tvl.crypto.ecdsa import P256_PARAMETERS
 from tvl.targets.model.internal.configuration_object import (
     CONFIG_OBJECT_SIZE_BYTES,
@@ -25,19 +40,62 @@ def one_of(__iterable: Iterable[T]) -> T:
     return sample_from(__iterable, k=1)[0]
 
 
+@lru_cache(maxsize=None)
+def _values_outside(__values: FrozenSet[int], /, nb_bytes: int) -> Tuple[int, ...]:
+    return tuple(set(range(2 ** (nb_bytes * 8) - 1)) - __values)
+
+
 def sample_outside(
     __iterable: Iterable[int], /, nb_bytes: int = 1, *, k: Optional[int] = None
 ) -> List[int]:
-    _set = set(range(2 ** (nb_bytes * 8) - 1)) - set(__iterable)
+    population = _values_outside(frozenset(__iterable), nb_bytes)
     if k is None:
-        k = len(_set)
-    return sample(list(_set), k=k)
+        k = len(population)
+    return sample(population, k=k)
 
 
 def one_outside(__iterable: Iterable[int], /, nb_bytes: int = 1) -> int:
     return sample_outside(__iterable, nb_bytes, k=1)[0]
 
 
+def randbytes(__rng: Random, __n: int, /) -> bytes:
+    """Generate `__n` pseudo-random bytes from a seeded generator"""
+    return __rng.getrandbits(__n * 8).to_bytes(__n, "little")
+
+
+def create_configuration() -> Dict[str, Any]:
+    """Create a fresh host/model configuration sharing a random pairing key"""
+    tropic_priv_key_ = X25519PrivateKey.generate()
+    tropic_priv_key_bytes = tropic_priv_key_.private_bytes_raw()
+    tropic_pub_key_bytes = tropic_priv_key_.public_key().public_bytes_raw()
+
+    host_priv_keys_ = [X25519PrivateKey.generate() for _ in range(S_HI_PUB_NB_SLOTS)]
+    host_priv_keys_bytes = [key.private_bytes_raw() for key in host_priv_keys_]
+    host_pub_keys_bytes = [
+        key.public_key().public_bytes_raw() for key in host_priv_keys_
+    ]
+
+    return ConfigurationFileModel.parse_obj(
+        {
+            "host": {
+                "s_h_priv": host_priv_keys_bytes,
+                "s_h_pub": host_pub_keys_bytes,
+                "s_t_pub": tropic_pub_key_bytes,
+                "pairing_key_index": (pki := randrange(S_HI_PUB_NB_SLOTS)),
+            },
+            "model": {
+                "s_t_priv": tropic_priv_key_bytes,
+                "s_t_pub": tropic_pub_key_bytes,
+                "i_pairing_keys": {
+                    pki: {
+                        "value": host_pub_keys_bytes[pki],
+                    },
+                },
+            },
+        }
+    ).dict(exclude_none=True)
+
+
 def as_slow(data: Sequence[Any], not_slow_nb: int):
     """Mark some parameters as slow"""
     slow_marker = pytest.mark.slow
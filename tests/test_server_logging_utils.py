@@ -0,0 +1,20 @@
+import os
+
+import pytest
+
+from tvl.server import logging_utils
+from tvl.server.logging_utils import LogDict, refresh_terminal_width
+
+
+@pytest.mark.parametrize("width", [20, 200])
+def test_log_dict_uses_refreshed_width(monkeypatch: pytest.MonkeyPatch, width: int):
+    monkeypatch.setattr(
+        logging_utils, "get_terminal_size", lambda: os.terminal_size((width, 24))
+    )
+    monkeypatch.setattr(logging_utils, "_terminal_width", 80)
+    refresh_terminal_width()
+
+    dct = {f"key_{i}": i for i in range(5)}
+    lines = str(LogDict(dct)).splitlines()[1:]
+    assert max(map(len, lines)) <= width
+    assert len(lines) == (1 if width == 200 else len(dct))
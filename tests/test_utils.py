@@ -0,0 +1,22 @@
+from typing import List
+
+import pytest
+
+from tvl.utils import split_data
+
+
+@pytest.mark.parametrize(
+    "data, chunk_size, expected",
+    [
+        pytest.param(b"abcdef", 2, [b"ab", b"cd", b"ef"], id="exact_multiple"),
+        pytest.param(b"abcdefg", 3, [b"abc", b"def", b"g"], id="partial_chunk"),
+        pytest.param(b"abc", 4, [b"abc"], id="single_chunk"),
+        pytest.param(b"", 4, [], id="empty"),
+        pytest.param(bytearray(b"abcde"), 2, [b"ab", b"cd", b"e"], id="bytearray"),
+        pytest.param(memoryview(b"abcde"), 2, [b"ab", b"cd", b"e"], id="memoryview"),
+    ],
+)
+def test_split_data(data: bytes, chunk_size: int, expected: List[bytes]):
+    chunks = list(split_data(data, chunk_size=chunk_size))
+    assert chunks == expected
+    assert all(type(chunk) is bytes for chunk in chunks)
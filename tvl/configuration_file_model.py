@@ -1,3 +1,5 @@
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -21,6 +23,11 @@ from .targets.model.internal.pairing_keys import PairingKeysModel
 from .targets.model.internal.user_data_partition import UserDataPartitionModel
 from .typing_utils import FixedSizeBytes, RangedInt, SizedBytes, SizedList
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class _BaseModel(BaseModel):
     class Config:
@@ -70,10 +77,34 @@ class ConfigurationDict(TypedDict):
     model: Dict[str, Any]
 
 
-def load_configuration_file(filename: Union[Path, str]) -> ConfigurationDict:
+@lru_cache(maxsize=32)
+def _load_configuration_file(
+    filename: Path, mtime_ns: int, size: int, inode: int
+) -> ConfigurationDict:
+    # `mtime_ns`, `size` and `inode` are only part of the cache key:
+    # a modified or replaced file is reloaded
     with open(filename, "r") as fd:
-        content = yaml.safe_load(fd)
+        content = yaml.load(fd, Loader=_SafeLoader)
     return {  # type: ignore
         **{"host": {}, "model": {}},
         **ConfigurationFileModel.parse_obj(content).dict(exclude_none=True),
     }
+
+
+def load_configuration_file(filename: Union[Path, str]) -> ConfigurationDict:
+    """Load and validate a configuration file.
+
+    The validated content is cached as long as the file is not modified;
+    each call returns a fresh copy that the caller is free to mutate.
+
+    Args:
+        filename (Union[Path, str]): path to the YAML configuration file
+
+    Returns:
+        the host and model configurations
+    """
+    path = Path(filename).resolve()
+    stat = path.stat()
+    return deepcopy(
+        _load_configuration_file(path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    )
@@ -54,7 +54,7 @@ def _send(data: bytes, target: TropicProtocol, logger: logging.Logger) -> None:
     target.spi_drive_csn_low()
 
     logger.info("Sending raw data")
-    logger.debug(f"Raw data: {data}")
+    logger.debug("Raw data: %s", data)
     target.spi_send(data)
 
     logger.info("Driving Chip Select to HIGH.")
@@ -70,7 +70,7 @@ def ll_receive(
 ) -> bytes:
     if wait > 0:
         logger.info("Waiting before polling.")
-        logger.debug(f"Wait time: {wait} us.")
+        logger.debug("Wait time: %s us.", wait)
         target.wait(wait)
 
     # poll for status
@@ -80,10 +80,10 @@ def ll_receive(
         # wait a bit until next try except at the beginning of the loop
         if i != start and retry_wait > 0:
             logger.info("Waiting before next try.")
-            logger.debug(f"Retry wait time: {retry_wait} us.")
+            logger.debug("Retry wait time: %s us.", retry_wait)
             target.wait(retry_wait)
 
-        logger.debug(f"- attempt no. {i}.")
+        logger.debug("- attempt no. %s.", i)
 
         # start communication
         logger.info("Driving Chip Select to LOW.")
@@ -98,17 +98,17 @@ def ll_receive(
         chip_status = recvd[0]
         try:
             chip_status = L1ChipStatusFlag(chip_status)
-            logger.debug(f"CHIP_STATUS: {chip_status!s}.")
+            logger.debug("CHIP_STATUS: %s.", chip_status)
         except ValueError:
-            logger.debug(f"Unknown CHIP_STATUS: {chip_status:#04x}.")
+            logger.debug("Unknown CHIP_STATUS: %#04x.", chip_status)
 
         # STATUS field - one byte
         status = recvd[1]
         try:
             status = L2StatusEnum(status)
-            logger.debug(f"STATUS: {status!s}.")
+            logger.debug("STATUS: %s.", status)
         except ValueError:
-            logger.debug(f"Unknown STATUS: {status:#04x}.")
+            logger.debug("Unknown STATUS: %#04x.", status)
 
         # if a response is ready, fetch it
         if status is not L2StatusEnum.NO_RESP:
@@ -126,18 +126,18 @@ def ll_receive(
 
     # LEN field - one byte
     rsp_len = response[1]
-    logger.debug(f"RSP_LEN: {rsp_len:#04x}.")
+    logger.debug("RSP_LEN: %#04x.", rsp_len)
 
     # fetching remaining bytes
     if rsp_len > 0:
-        logger.debug(f"Fetching {rsp_len} remaining bytes.")
+        logger.debug("Fetching %s remaining bytes.", rsp_len)
         response += target.spi_send(bytes(rsp_len))
 
     # end communication
     logger.info("Driving Chip Select to HIGH.")
     target.spi_drive_csn_high()
 
-    logger.debug(f"Received {response}.")
+    logger.debug("Received %s.", response)
     return response
 
 
@@ -150,7 +150,7 @@ def ll_receive_check_irq(
 ) -> bytes:
     if wait > 0:
         logger.info("Waiting before polling.")
-        logger.debug(f"Wait time: {wait} us.")
+        logger.debug("Wait time: %s us.", wait)
         target.wait(wait)
 
     # poll for status
@@ -160,10 +160,10 @@ def ll_receive_check_irq(
         # wait a bit until next try except at the beginning of the loop
         if i != start and retry_wait > 0:
             logger.info("Waiting before next try.")
-            logger.debug(f"Retry wait time: {retry_wait} us.")
+            logger.debug("Retry wait time: %s us.", retry_wait)
             target.wait(retry_wait)
 
-        logger.debug(f"- attempt no. {i}.")
+        logger.debug("- attempt no. %s.", i)
 
         # check a new l2 response is ready
         if target.irq_state():
@@ -183,35 +183,35 @@ def ll_receive_check_irq(
     chip_status = recvd[0]
     try:
         chip_status = L1ChipStatusFlag(chip_status)
-        logger.debug(f"CHIP_STATUS: {chip_status!s}.")
+        logger.debug("CHIP_STATUS: %s.", chip_status)
     except ValueError:
-        logger.debug(f"Unknown CHIP_STATUS: {chip_status:#04x}.")
+        logger.debug("Unknown CHIP_STATUS: %#04x.", chip_status)
 
     # STATUS field - one byte
     status = recvd[1]
     try:
         status = L2StatusEnum(status)
-        logger.debug(f"STATUS: {status!s}.")
+        logger.debug("STATUS: %s.", status)
     except ValueError:
-        logger.debug(f"Unknown STATUS: {status:#04x}.")
+        logger.debug("Unknown STATUS: %#04x.", status)
 
     # start accumulating bytes
     response = recvd[1:]
 
     # LEN field - one byte
     rsp_len = response[1]
-    logger.debug(f"RSP_LEN: {rsp_len:#04x}.")
+    logger.debug("RSP_LEN: %#04x.", rsp_len)
 
     # fetching remaining bytes
     if rsp_len > 0:
-        logger.debug(f"Fetching {rsp_len} remaining bytes.")
+        logger.debug("Fetching %s remaining bytes.", rsp_len)
         response += target.spi_send(bytes(rsp_len))
 
     # end communication
     logger.info("Driving Chip Select to HIGH.")
     target.spi_drive_csn_high()
 
-    logger.debug(f"Received {response}.")
+    logger.debug("Received %s.", response)
     return response
 
 
@@ -257,7 +257,7 @@ def ll_send_l3_command(
         start=1,
     ):
         logger.info("+ Sending chunk +")
-        logger.debug(f"Chunk {i}/{len_cmd_chunks}.")
+        logger.debug("Chunk %s/%s.", i, len_cmd_chunks)
         recvd = send_chunk_fn(cmd_chunk, target, logger)
         status = recvd[0]
         check_fn(status)
@@ -270,7 +270,7 @@ def ll_send_l3_command(
         start=1,
     ):
         result_chunk = receive_fn(target, logger)
-        logger.debug(f"Receiving chunk {i}.")
+        logger.debug("Receiving chunk %s.", i)
         result_chunks.append(result_chunk)
         if result_chunk[0] != L2StatusEnum.RES_CONT:
             break
@@ -108,4 +108,4 @@ class LogIter:
         self.sep = sep
 
     def __str__(self) -> str:
-        return self.sep.join(self.fmt % elt for elt in self.it)
+        return self.sep.join(map(self.fmt.__mod__, self.it))
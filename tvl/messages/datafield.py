@@ -1,16 +1,18 @@
 import struct
 from contextlib import contextmanager
-from dataclasses import InitVar, dataclass
+from dataclasses import FrozenInstanceError
 from enum import Enum
-from functools import singledispatch
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Generic,
     Iterator,
     List,
     Optional,
+    Tuple,
     TypedDict,
     TypeVar,
     Union,
@@ -47,6 +49,11 @@ class _AUTO(bytes):
     def __repr__(self) -> str:
         return "AUTO"
 
+    def __reduce__(self) -> str:
+        # copies and unpickled objects refer to the singleton itself,
+        # so that identity checks against AUTO keep working
+        return "AUTO"
+
 
 AUTO = _AUTO()
 """AUTO value for specific fields. Conversion of these must be implemented."""
@@ -62,37 +69,112 @@ class Dtype(str, Enum):
 
     __str__ = str.__str__
 
-    @property
-    def nb_bytes(self) -> int:
-        return struct.calcsize(self.value)
+    nb_bytes: int
+    """Size in bytes of an element of this type"""
+
+
+for _dtype in Dtype:
+    _dtype.nb_bytes = struct.calcsize(_dtype.value)
+del _dtype
 
 
-@dataclass(frozen=True)
 class Params:
     """Define the parameters of a DataField."""
 
+    __slots__ = (
+        "dtype",
+        "min_size",
+        "max_size",
+        "priority",
+        "is_data",
+        "default",
+        "nb_bytes",
+        "has_variable_size",
+        "_repr",
+    )
+
     dtype: Dtype
-    size: InitVar[Optional[int]] = None
-    min_size: int = 1
-    max_size: int = 1
-    priority: int = 0
-    is_data: bool = True
-    default: DataFieldInputData = 0
-
-    def __post_init__(self, size: Optional[int]):
+    min_size: int
+    max_size: int
+    priority: int
+    is_data: bool
+    default: DataFieldInputData
+    nb_bytes: int
+    """Size in bytes of one element, cached from `dtype`"""
+    has_variable_size: bool
+    """A field can contain a variable number of elements."""
+    _repr: str
+
+    def __init__(
+        self,
+        dtype: Dtype,
+        size: Optional[int] = None,
+        min_size: int = 1,
+        max_size: int = 1,
+        priority: int = 0,
+        is_data: bool = True,
+        default: DataFieldInputData = 0,
+    ) -> None:
         if size is not None:
-            object.__setattr__(self, "min_size", size)
-            object.__setattr__(self, "max_size", size)
-        if self.min_size < 0:
+            min_size = max_size = size
+        if min_size < 0:
             raise ParamError("Min size should be at least 0.")
-        if self.max_size < 1:
+        if max_size < 1:
             raise ParamError("Max size should be at least 1.")
-        if self.max_size < self.min_size:
+        if max_size < min_size:
             raise ParamError("Max size should be greater than or equal to min size.")
+        _set = super().__setattr__
+        _set("dtype", dtype)
+        _set("min_size", min_size)
+        _set("max_size", max_size)
+        _set("priority", priority)
+        _set("is_data", is_data)
+        _set("default", default)
+        _set("nb_bytes", dtype.nb_bytes)
+        _set("has_variable_size", min_size != max_size)
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return (
+            self.dtype,
+            self.min_size,
+            self.max_size,
+            self.priority,
+            self.is_data,
+            self.default,
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        dtype, *others = self._astuple()
+        return self.__class__, (dtype, None, *others)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
 
-    def has_variable_size(self) -> bool:
-        """A field can contain a variable number of elements."""
-        return self.min_size != self.max_size
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._astuple() == other._astuple()  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        # the instance is frozen, build the representation once
+        try:
+            return self._repr
+        except AttributeError:
+            pass
+        _repr = (
+            f"{self.__class__.__qualname__}(dtype={self.dtype!r}, "
+            f"min_size={self.min_size!r}, max_size={self.max_size!r}, "
+            f"priority={self.priority!r}, is_data={self.is_data!r}, "
+            f"default={self.default!r})"
+        )
+        super().__setattr__("_repr", _repr)
+        return _repr
 
 
 class _ParamsFnArgs(TypedDict, total=False):
@@ -122,91 +204,98 @@ def datafield(**kwargs: Unpack[_ParamsFnArgs]) -> Any:
     return kwargs
 
 
-@singledispatch
-def _format_to_list(value: Any, instance: "DataField[Any]") -> List[int]:
-    raise TypeNotSupportedError(f"Type {type(value)} not supported.")
+@lru_cache(maxsize=None)
+def _packer(endianness_fmt: str, dtype: str, count: int) -> struct.Struct:
+    """Compiled struct converting `count` elements of type `dtype`"""
+    return struct.Struct(f"{endianness_fmt}{count}{dtype}")
 
 
-@_format_to_list.register(int)
-def _(value: int, instance: "DataField[Any]") -> List[int]:
+def _from_int(value: int, instance: "DataField[Any]") -> List[int]:
     return [value]
 
 
-@_format_to_list.register(bytes)
-def _(value: bytes, instance: "DataField[Any]") -> List[int]:
+def _from_bytes(value: bytes, instance: "DataField[Any]") -> List[int]:
+    fmt = endianness.fmt
     try:
-        return list(struct.unpack(f"{endianness.fmt}{instance.params.dtype}", value))
+        return list(_packer(fmt, instance.params.dtype.value, 1).unpack(value))
     except struct.error:
-        return list(struct.unpack(f"{endianness.fmt}{len(value)}{Dtype.UINT8}", value))
+        return list(_packer(fmt, Dtype.UINT8.value, len(value)).unpack(value))
 
 
-@_format_to_list.register(list)
-def _(value: List[int], instance: "DataField[Any]") -> List[int]:
+def _from_list(value: List[int], instance: "DataField[Any]") -> List[int]:
     return value
 
 
-class ValueDescriptor(Generic[T]):
-    def __set_name__(self, _, name: str) -> None:
-        self.name = f"_{name}"
+_FORMAT_DISPATCH: Dict[type, Callable[[Any, "DataField[Any]"], List[int]]] = {
+    int: _from_int,
+    bytes: _from_bytes,
+    list: _from_list,
+}
+"""Conversion function for each supported type of input value"""
+
+
+def _format_to_list(value: Any, instance: "DataField[Any]") -> List[int]:
+    if (fn := _FORMAT_DISPATCH.get(type(value))) is None:
+        # subclasses of the supported types, e.g. enum members
+        for tp, fn in _FORMAT_DISPATCH.items():
+            if isinstance(value, tp):
+                _FORMAT_DISPATCH[type(value)] = fn
+                break
+        else:
+            raise TypeNotSupportedError(f"Type {type(value)} not supported.")
+    return fn(value, instance)
+
+
+class DataField(Generic[T]):
+    """Base class for defining the fields of a message"""
 
-    def __init__(self, getter_fn: Callable[[List[int]], T]) -> None:
-        self.getter_fn = getter_fn
+    __slots__ = ("params", "_value")
 
-    def __set__(self, instance: "DataField[Any]", value: DataFieldInputData) -> None:
+    def __init__(self, value: DataFieldInputData, params: Params) -> None:
+        self._value: Union[List[int], _AUTO]
+        self.params = params
+        self._set_value(value)
+
+    def _set_value(self, value: DataFieldInputData) -> None:
         """Sets the value of a DataField
 
         Args:
-            instance (DataField[Any]): field of which the value wll be written
             value (DataFieldInputData): the value to write
 
         Raises:
             TypeNotSupportedError: cannot process the type of value
             ListTooLongError: the value array contains too many elements
         """
-
         if value is AUTO:
-            setattr(instance, self.name, value)
+            self._value = value
             return
 
-        value = _format_to_list(value, instance)
+        if (tp := type(value)) is int:
+            value = [value]
+        elif tp is not list:
+            value = _format_to_list(value, self)
+
+        params = self.params
 
         # check list length
-        if (length := len(value)) > (_max := instance.params.max_size):
-            raise ListTooLongError(f"{length=} > {_max}.")
+        if (length := len(value)) > (max_size := params.max_size):
+            raise ListTooLongError(f"{length=} > {max_size}.")
 
-        # pad with zeroes
-        if instance.params.has_variable_size():
-            min_length = instance.params.min_size
-        else:
-            min_length = instance.params.max_size
-        if (padding_length := min_length - length) > 0:
+        # pad with zeroes up to the minimum size,
+        # which is also the maximum size for fixed-size fields
+        if (padding_length := params.min_size - length) > 0:
             value.extend([0] * padding_length)
 
-        setattr(instance, self.name, value)
-
-    def __get__(self, instance: "DataField[Any]", _) -> T:
-        """Gets the value of a DataField
+        self._value = value
 
-        Args:
-            instance (DataField[Any]): the field from which read the value
-
-        Returns:
-            the value of the field
-        """
-        if (value := getattr(instance, self.name)) is AUTO:
-            return value
-        return self.getter_fn(value)
-
-
-class DataField(Generic[T]):
-    """Base class for defining the fields of a message"""
+    @property
+    def value(self) -> T:
+        """Value of the field, AUTO or the elements it contains"""
+        return self._value  # type: ignore
 
-    value: ValueDescriptor[T]
-
-    def __init__(self, value: DataFieldInputData, params: Params) -> None:
-        self._value: Union[List[int], _AUTO]
-        self.params = params
-        self.value = value
+    @value.setter
+    def value(self, value: DataFieldInputData) -> None:
+        self._set_value(value)
 
     def __str__(self) -> str:
         return (
@@ -214,9 +303,9 @@ class DataField(Generic[T]):
         )
 
     def __len__(self) -> int:
-        if isinstance(self._value, _AUTO):
-            return self.params.min_size * self.params.dtype.nb_bytes
-        return len(self._value) * self.params.dtype.nb_bytes
+        if self._value is AUTO:
+            return self.params.min_size * self.params.nb_bytes
+        return len(self._value) * self.params.nb_bytes
 
     if TYPE_CHECKING:
         # dummy setter for IDE during message initialization
@@ -237,18 +326,17 @@ class DataField(Generic[T]):
             self.value = previous_value
 
     def to_bytes(self) -> bytes:
-        assert isinstance(self._value, list), f"'{self._value}' is not a list"
+        assert self._value is not AUTO, f"'{self._value}' is not a list"
         try:
-            return struct.pack(
-                f"{endianness.fmt}{len(self._value)}{self.params.dtype}",
-                *self._value,
-            )
+            return _packer(
+                endianness.fmt, self.params.dtype.value, len(self._value)
+            ).pack(*self._value)
         except struct.error as exc:
             raise DataValueError(f"Wrong value={self._value}: {exc}") from None
 
     def hexstr(self) -> str:
         """Hexadecimal representation"""
-        if isinstance(value := self._value, _AUTO):
+        if (value := self._value) is AUTO:
             return str(value)
         if isinstance(value, Enum):
             return repr(value)
@@ -260,19 +348,41 @@ class DataField(Generic[T]):
 
 
 class ScalarDataField(DataField[int]):
-    value = ValueDescriptor(getter_fn=lambda x: x[0])
+    __slots__ = ()
+
+    def _get_value(self) -> int:
+        if (value := self._value) is AUTO:
+            return value  # type: ignore
+        return value[0]  # type: ignore
+
+    value = property(_get_value, DataField._set_value)  # type: ignore
+
+    def to_bytes(self) -> bytes:
+        assert self._value is not AUTO, f"'{self._value}' is not a list"
+        try:
+            return _packer(endianness.fmt, self.params.dtype.value, 1).pack(
+                self._value[0]
+            )
+        except struct.error as exc:
+            raise DataValueError(f"Wrong value={self._value}: {exc}") from None
 
     def _hexstr(self) -> str:
-        nb_chars = self.params.dtype.nb_bytes * 2
+        nb_chars = self.params.nb_bytes * 2
         return f"{self.value:0{nb_chars}x}"
 
 
 class ArrayDataField(DataField[List[int]]):
-    value = ValueDescriptor(getter_fn=lambda x: x)
+    __slots__ = ()
 
     def _hexstr(self) -> str:
-        nb_chars = self.params.dtype.nb_bytes * 2
-        return f"[{', '.join(f'{x:0{nb_chars}x}' for x in self.value)}]"
+        if self.params.dtype is Dtype.UINT8:
+            try:
+                # bytes.hex() only accepts a single-character separator
+                return f"[{bytes(self.value).hex(',').replace(',', ', ')}]"
+            except ValueError:
+                pass  # some value does not fit in a byte
+        fmt = f"0{self.params.nb_bytes * 2}x"
+        return f"[{', '.join(format(x, fmt) for x in self.value)}]"
 
 
 U8Scalar = Annotated[ScalarDataField, datafield(dtype=Dtype.UINT8, size=1)]
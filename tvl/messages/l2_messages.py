@@ -4,10 +4,13 @@ from typing import Any, ContextManager, Tuple
 from typing_extensions import Self
 
 from ..crypto.hash import crc16
-from .datafield import AUTO, DataField, U8Scalar, U16Scalar, datafield
+from .datafield import AUTO, DataField, Dtype, U8Scalar, U16Scalar, datafield
+from .endianness import endianness
 from .exceptions import UnauthorizedInstantiationError
 from .message import Message
 
+_CRC_NB_BYTES = Dtype.UINT16.nb_bytes
+
 
 class L2Frame(Message):
     """Base class for L2 messages"""
@@ -44,6 +47,21 @@ class L2Frame(Message):
         """
         return self.crc.value is AUTO or self.crc.value == self.compute_crc()
 
+    @staticmethod
+    def has_valid_raw_crc(__data: bytes, /) -> bool:
+        """Check the CRC of a serialized message without deserializing it.
+
+        Args:
+            __data (bytes): the serialized message, CRC field included
+
+        Returns:
+            True if the trailing CRC field matches the rest of the message
+        """
+        if len(__data) < _CRC_NB_BYTES:
+            return False
+        data, crc = __data[:-_CRC_NB_BYTES], __data[-_CRC_NB_BYTES:]
+        return crc16(data) == int.from_bytes(crc, endianness.get())
+
     def update_crc(self) -> None:
         """Update crc of the message."""
         self.crc.value = self.compute_crc()
@@ -44,8 +44,8 @@ class _MetaMessage(type):
     """
     Metaclass of the Message class.
 
-    Make sure the field names are unique
-    and add parameters to the DataField objects
+    Make sure the field names are unique, add parameters to the DataField
+    objects and store the fields in slots rather than in a per-instance dict
     """
 
     def __new__(
@@ -58,6 +58,7 @@ class _MetaMessage(type):
         existing_fields = {n for base in bases for n, *_ in _get_specs(base)}
 
         annotations: Dict[str, Any] = namespace.get("__annotations__", {})
+        field_names: List[str] = []
 
         for field_name, field_annot in annotations.items():
             if field_name in _RESERVED_FIELD_NAMES:
@@ -84,6 +85,9 @@ class _MetaMessage(type):
             params = Params(**ChainMap(*params_args, namespace.pop(field_name, {})))
 
             annotations[field_name] = Annotated[tp, params]  # type: ignore
+            field_names.append(field_name)
+
+        namespace.setdefault("__slots__", tuple(field_names))
 
         return super().__new__(mcs, name, bases, namespace, **kwargs)
 
@@ -112,7 +116,8 @@ class BaseMessage(metaclass=_MetaMessage):
         return NotImplemented
 
     def __iter__(self) -> Iterator[Tuple[str, DataField[Any]]]:
-        yield from self.__dict__.items()
+        for name, *_ in self.specs():
+            yield name, getattr(self, name)
 
     def __len__(self) -> int:
         return sum(len(field) for _, field in self)
@@ -165,7 +170,7 @@ class BaseMessage(metaclass=_MetaMessage):
             fmt_dict[name] = (params.min_size, params.dtype)
 
             # If a field has a variable size, mark it and perform a second pass
-            if params.has_variable_size():
+            if params.has_variable_size:
                 if varsize_field_name is not None:
                     raise RuntimeError(
                         "Only one field is allowed to have a variable size"
@@ -211,11 +216,18 @@ class Message(BaseMessage):
         """
         if id is not None:
             cls.ID = id
+        # the class hierarchy changed, previous lookups may be incomplete
+        Message._lookup_subclasses.cache_clear()
 
     @classmethod
     def find_subclasses(cls, id: int) -> List[Type[Self]]:
         """Find all the subclasses with the specified id."""
-        return [s for s in iter_subclasses(cls) if getattr(s, "ID", None) == id]
+        return list(cls._lookup_subclasses(id))
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _lookup_subclasses(cls, id: int) -> Tuple[Type[Self], ...]:
+        return tuple(s for s in iter_subclasses(cls) if getattr(s, "ID", None) == id)
 
     @classmethod
     def instantiate_subclass(cls, id: int, data: bytes) -> Self:
@@ -248,9 +260,12 @@ class Message(BaseMessage):
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def with_data_length(cls, length: int) -> Type[Self]:
         """Create a new subclass having a field 'data' with a specific length.
 
+        The subclass is created once per class and length and reused afterwards.
+
         Returns:
             the new subclass
         """
@@ -43,6 +43,16 @@ DEFAULT_LOGGING_CONFIG: Dict[str, Any] = {
 }
 
 
+_terminal_width = get_terminal_size()[0]
+
+
+def refresh_terminal_width() -> None:
+    """Update the width used to format LogDict objects,
+    e.g. after the terminal was resized."""
+    global _terminal_width
+    _terminal_width = get_terminal_size()[0]
+
+
 class LogDict:
     def __init__(
         self,
@@ -56,7 +66,7 @@ class LogDict:
     def __str__(self) -> str:
         return "\n" + pformat(
             self.fn(self.dct) if self.fn is not None else self.dct,
-            width=get_terminal_size()[0],
+            width=_terminal_width,
         )
 
 
@@ -67,7 +77,7 @@ class LogIter:
         self.sep = sep
 
     def __str__(self) -> str:
-        return self.sep.join(self.fmt % elt for elt in self.it)
+        return self.sep.join(map(self.fmt.__mod__, self.it))
 
 
 def configure_logging(filepath: Optional[Path] = None) -> None:
@@ -7,7 +7,12 @@ from pathlib import Path
 from textwrap import dedent
 from typing import Callable
 
-from .logging_utils import LogDict, configure_logging, dump_logging_configuration
+from .logging_utils import (
+    LogDict,
+    configure_logging,
+    dump_logging_configuration,
+    refresh_terminal_width,
+)
 from .serial_connection import (
     SERIAL_DEFAULT_BAUDRATE,
     SERIAL_DEFAULT_PORT,
@@ -134,6 +139,7 @@ def get_input_arguments():
 
 def main() -> None:
     kwargs = get_input_arguments()
+    refresh_terminal_width()
     configure_logging(kwargs.get("logging_configuration"))
     kwargs["logger"] = logger = logging.getLogger("server")
     logger.debug("Arguments:%s", LogDict(kwargs))
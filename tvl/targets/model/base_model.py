@@ -1,5 +1,5 @@
 import logging
-from functools import partial, singledispatchmethod
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -10,8 +10,8 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     Type,
-    TypeVar,
     Union,
     overload,
 )
@@ -44,9 +44,33 @@ class SupportsFromDict(Protocol):
         ...
 
 
-T = TypeVar("T")
+_DUMMY_TAG = b"\x00" * ENCRYPTION_TAG_LEN
+"""Tag appended to L3 results when encryption is deactivated"""
 
-D = TypeVar("D", bound=SupportsFromDict)
+_PARTITIONS: Tuple[Tuple[str, Type[SupportsFromDict]], ...] = (
+    ("r_config", ConfigurationObjectImpl),
+    ("r_ecc_keys", EccKeys),
+    ("r_user_data", UserDataPartition),
+    ("r_mcounters", MCounters),
+    ("r_macandd_data", MacAndDestroyData),
+    ("i_config", ConfigurationObjectImpl),
+    ("i_pairing_keys", PairingKeys),
+)
+"""Model parameters built from their dict representation"""
+
+_PLAIN_PARAMETERS = (
+    "s_t_priv",
+    "s_t_pub",
+    "x509_certificate",
+    "chip_id",
+    "riscv_fw_version",
+    "spect_fw_version",
+    "activate_encryption",
+    "debug_random_value",
+    "init_byte",
+    "busy_iter",
+)
+"""Model parameters passed as is"""
 
 
 class BaseModel(MetaModel):
@@ -120,29 +144,30 @@ class BaseModel(MetaModel):
                 Defaults to None.
         """
 
-        def __factory(value: Optional[T], default: Callable[[], T]) -> T:
-            if value is not None:
-                return value
-            return default()
-
         # --- R-Memory Partitions ---
 
-        self.r_config = __factory(r_config, ConfigurationObjectImpl)
+        self.r_config = r_config if r_config is not None else ConfigurationObjectImpl()
         """Reversible chip configuration"""
-        self.r_ecc_keys = __factory(r_ecc_keys, EccKeys)
+        self.r_ecc_keys = r_ecc_keys if r_ecc_keys is not None else EccKeys()
         """Keys for Elliptic Curve Cryptography (ECDSA/EdDSA) algorithms"""
-        self.r_user_data = __factory(r_user_data, UserDataPartition)
+        self.r_user_data = (
+            r_user_data if r_user_data is not None else UserDataPartition()
+        )
         """General purpose storage for user data"""
-        self.r_mcounters = __factory(r_mcounters, MCounters)
+        self.r_mcounters = r_mcounters if r_mcounters is not None else MCounters()
         """Data for Monotonic Counters"""
-        self.r_macandd_data = __factory(r_macandd_data, MacAndDestroyData)
+        self.r_macandd_data = (
+            r_macandd_data if r_macandd_data is not None else MacAndDestroyData()
+        )
         """Mac and Destroy infrastructure"""
 
         # --- I-Memory Partitions ---
 
-        self.i_config = __factory(i_config, ConfigurationObjectImpl)
+        self.i_config = i_config if i_config is not None else ConfigurationObjectImpl()
         """Irreversible chip configuration."""
-        self.i_pairing_keys = __factory(i_pairing_keys, PairingKeys)
+        self.i_pairing_keys = (
+            i_pairing_keys if i_pairing_keys is not None else PairingKeys()
+        )
         """The Host's X25519 public key used by TROPIC01 during a handshake"""
         self.s_t_priv = s_t_priv
         """The TROPIC01 X25519 private key"""
@@ -235,35 +260,14 @@ class BaseModel(MetaModel):
             a new model
         """
 
-        def __d(n: str, t: Type[D]) -> Dict[str, Optional[D]]:
-            if (cfg := __mapping.get(n)) is None:
-                return {}
-            return {n: t.from_dict(cfg)}
-
-        def __s(n: str) -> Dict[str, Any]:
-            if (v := __mapping.get(n)) is None:
-                return {}
-            return {n: v}
-
-        return cls(
-            **__d("r_config", ConfigurationObjectImpl),
-            **__d("r_ecc_keys", EccKeys),
-            **__d("r_user_data", UserDataPartition),
-            **__d("r_mcounters", MCounters),
-            **__d("r_macandd_data", MacAndDestroyData),
-            **__d("i_config", ConfigurationObjectImpl),
-            **__d("i_pairing_keys", PairingKeys),
-            **__s("s_t_priv"),
-            **__s("s_t_pub"),
-            **__s("x509_certificate"),
-            **__s("chip_id"),
-            **__s("riscv_fw_version"),
-            **__s("spect_fw_version"),
-            **__s("activate_encryption"),
-            **__s("debug_random_value"),
-            **__s("init_byte"),
-            **__s("busy_iter"),
-        )
+        kwargs: Dict[str, Any] = {}
+        for name, type_ in _PARTITIONS:
+            if (cfg := __mapping.get(name)) is not None:
+                kwargs[name] = type_.from_dict(cfg)
+        for name in _PLAIN_PARAMETERS:
+            if (value := __mapping.get(name)) is not None:
+                kwargs[name] = value
+        return cls(**kwargs)
 
     def wait(self, usecs: int) -> None:
         """Wait for the model
@@ -289,7 +293,6 @@ class BaseModel(MetaModel):
     def spi_send(self, data: bytes) -> bytes:
         ...
 
-    @singledispatchmethod
     def spi_send(self, data: Union[List[int], bytes]) -> Union[List[int], bytes]:
         """Send data through the SPI bus in half-duplex mode.
 
@@ -299,16 +302,12 @@ class BaseModel(MetaModel):
         Returns:
             the response of the TROPIC01.
         """
+        if isinstance(data, bytes):
+            return self.spi_fsm.process_spi_data(data)
+        if isinstance(data, list):
+            return list(self.spi_send(bytes(data)))
         raise TypeError(f"{type(data)} not supported")
 
-    @spi_send.register(list)  # type: ignore
-    def _(self, data: List[int]) -> List[int]:
-        return list(self.spi_send(bytes(data)))
-
-    @spi_send.register  # type: ignore
-    def _(self, data: bytes) -> bytes:
-        return self.spi_fsm.process_spi_data(data)
-
     def process_input(self, data: bytes) -> Union[bytes, List[bytes]]:
         """Process the received L2 request - should be overridden by the API.
 
@@ -331,18 +330,16 @@ class BaseModel(MetaModel):
         return [response.to_bytes() for response in responses]
 
     def _process_input(self, data: bytes) -> Union[L2Response, List[L2Response]]:
-        self.logger.debug("Parsing raw L2 request %s.", data)
-        request = L2Request.with_length(len(data)).from_bytes(data)
-
-        self.logger.info("Checking checksum of %s", request)
-        if not request.has_valid_crc():
+        self.logger.info("Checking checksum of raw L2 request %s", data)
+        if not L2Request.has_valid_raw_crc(data):
             self.logger.debug("Checksum is incorrect.")
             return L2Response(status=L2StatusEnum.CRC_ERR)
         self.logger.debug("Checksum is correct.")
 
         self.logger.debug("Parsing L2 request.")
         try:
-            request = self.parse_request_fn(request.id.value, data)
+            # the ID field is the first byte of the request
+            request = self.parse_request_fn(data[0], data)
         except SubclassNotFoundError as exc:
             self.logger.debug(exc)
             return L2Response(status=L2StatusEnum.UNKNOWN_REQ)
@@ -435,7 +432,8 @@ class BaseModel(MetaModel):
             self.uap_logger.debug("Encryption deactivated, bypassing check.")
             return
         self.uap_logger.debug("Pairing key slot #%d", self.pairing_key_slot)
-        self.uap_logger.debug("Configuration field: %s", bin(value))
+        if self.uap_logger.isEnabledFor(logging.DEBUG):
+            self.uap_logger.debug("Configuration field: %s", bin(value))
         if not 0 <= self.pairing_key_slot < S_HI_PUB_NB_SLOTS:
             raise RuntimeError("Chip not paired yet.")
         if not value & 2**self.pairing_key_slot:
@@ -465,7 +463,7 @@ class BaseModel(MetaModel):
         """
         if self.activate_encryption:
             return self.session.encrypt_response(result)
-        return result + b"\x00" * ENCRYPTION_TAG_LEN
+        return result + _DUMMY_TAG
 
     def decrypt_command(self, command: bytes) -> Optional[bytes]:
         """Decrypt the received raw command.
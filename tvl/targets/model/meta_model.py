@@ -1,9 +1,12 @@
 import logging
 from collections import defaultdict
-from functools import reduce, singledispatchmethod, wraps
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import wraps
 from typing import (
     Any,
     Callable,
+    ClassVar,
     DefaultDict,
     Dict,
     List,
@@ -11,7 +14,10 @@ from typing import (
     Protocol,
     Tuple,
     TypeVar,
-    cast,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
 
 
@@ -21,8 +27,59 @@ class HasLogger(Protocol):
 
 F = TypeVar("F", bound=Callable[..., Any])
 
-__api_base__ = "__api_base__"
-__api_overload__ = "__api_overload__"
+__api_members__ = "__api_members__"
+__api_logged__ = "__api_logged__"
+__api_log_wrapper__ = "__api_log_wrapper__"
+
+_DispatchTable = Dict[type, Callable[..., Any]]
+_Overload = Tuple[str, Optional[Tuple[type, ...]], Callable[..., Any]]
+
+
+@dataclass
+class _ApiMembers:
+    """Base methods and overloads defined in the namespace of a class"""
+
+    bases: List[str] = field(default_factory=list)
+    """identifiers of the base methods"""
+    overloads: Dict[str, List[_Overload]] = field(default_factory=dict)
+    """name, types and decorated method of the overloads, indexed by base
+    method identifier"""
+
+
+class _ApiMethod:
+    """Method decorated by `base` or `api`.
+
+    Records the method in the registry of the class it is defined in, then
+    replaces itself with the method in the namespace of that class. Outside
+    of a class body, calling it calls the method.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        id_: str,
+        types: Optional[Tuple[type, ...]],
+        is_base: bool,
+    ) -> None:
+        self.method = method
+        self.id = id_
+        self.types = types
+        self.is_base = is_base
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.method(*args, **kwargs)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if (members := owner.__dict__.get(__api_members__)) is None:
+            members = _ApiMembers()
+            setattr(owner, __api_members__, members)
+        if self.is_base:
+            members.bases.append(self.id)
+        else:
+            members.overloads.setdefault(self.id, []).append(
+                (name, self.types, self.method)
+            )
+        setattr(owner, name, self.method)
 
 
 class MetaModel:
@@ -30,33 +87,59 @@ class MetaModel:
     Base class for the TROPIC01 model
 
     Allows methods to be defined as base methods in the api and overloads
-    these latter. Uses the `singledispatchmethod` mechanism.
+    these latter. Each class holds, for every base method, a table mapping
+    the type of the argument to the overload processing it.
     """
 
+    _dispatch_tables: ClassVar[Dict[str, _DispatchTable]] = {}
+    """Overloads of the base methods, indexed by the type they process"""
+    log_dispatch: ClassVar[bool] = True
+    """Log the execution of the overloads; set to False in a subclass to
+    call them without the logging wrapper"""
+
     def __init_subclass__(cls) -> None:
-        base_fns: Dict[str, "singledispatchmethod[Any]"] = {}
-        overs: DefaultDict[
-            str, List[Tuple[str, Optional[Tuple[type, ...]]]]
-        ] = defaultdict(list)
-
-        for cls_ in reversed(cls.__mro__[:-2]):
-            for attr_name, attr in cls_.__dict__.items():
-                # collect the base methods
-                if (id_ := getattr(attr, __api_base__, None)) is not None:
-                    base_fns[id_] = attr
-                # collect the overloads and their associated types
-                elif (tp := getattr(attr, __api_overload__, None)) is not None:
-                    id_, types = tp
-                    overs[id_].append((attr_name, types))
-
-        # register the overloads of the base methods
-        for id_, base_fn in base_fns.items():
-            for over_name, types in overs[id_]:
-                setattr(
-                    cls,
-                    over_name,
-                    _log(_register(base_fn, getattr(cls, over_name), types)),
-                )
+        cls._dispatch_tables = tables = {}
+        # overloads found before their base method in the MRO
+        pending: DefaultDict[str, List[_Overload]] = defaultdict(list)
+
+        # walk the members registered by the classes, skipping the classes
+        # without any (MetaModel, object, plain mixins...)
+        for cls_ in reversed(cls.__mro__):
+            members: Optional[_ApiMembers] = cls_.__dict__.get(__api_members__)
+            if members is None:
+                continue
+            for id_ in members.bases:
+                if id_ not in tables:
+                    tables[id_] = {}
+                    for overload in pending.pop(id_, ()):
+                        cls._register_overload(id_, *overload)
+            for id_, cls_over in members.overloads.items():
+                if id_ not in tables:
+                    pending[id_].extend(cls_over)
+                    continue
+                for overload in cls_over:
+                    cls._register_overload(id_, *overload)
+
+    @classmethod
+    def _register_overload(
+        cls,
+        __id: str,
+        __name: str,
+        __types: Optional[Tuple[type, ...]],
+        __decorated: Callable[..., Any],
+        /,
+    ) -> None:
+        """Register the implementation of an overload in the dispatch table."""
+        if __types is None:
+            # register with the types annotated on the decorated method,
+            # even if a subclass overrides it
+            __types = _annotated_types(__decorated)
+        over = getattr(cls, __name)
+        # the implementation itself, without the wrapper set for a parent class
+        impl = over.__wrapped__ if getattr(over, __api_logged__, False) else over
+        over = _log(over) if cls.log_dispatch else impl
+        _register(cls._dispatch_tables[__id], over, __types)
+        setattr(cls, __name, over)
 
 
 def base(__id: str, /) -> Callable[[F], F]:
@@ -66,13 +149,26 @@ def base(__id: str, /) -> Callable[[F], F]:
         __id (str): the identifier of the method.
 
     Returns:
-        the same method, marked as base.
+        the method dispatching its argument to the overloads of the base,
+            the decorated method processes the arguments without overload.
     """
 
     def _base(method: F) -> F:
-        _method = singledispatchmethod(method)
-        setattr(_method, __api_base__, __id)
-        return cast(F, _method)
+        @wraps(method)
+        def _dispatch(self: MetaModel, request: Any) -> Any:
+            table = self._dispatch_tables[__id]
+            cls = request.__class__
+            try:
+                fn = table[cls]
+            except KeyError:
+                # first call with this type: look for an overload of one
+                # of its parents and remember the outcome
+                fn = table[cls] = next(
+                    (table[c] for c in cls.__mro__ if c in table), method
+                )
+            return fn(self, request)
+
+        return _ApiMethod(_dispatch, __id, None, is_base=True)  # type: ignore
 
     return _base
 
@@ -80,47 +176,101 @@ def base(__id: str, /) -> Callable[[F], F]:
 def api(__id: str, __dt: Optional[Tuple[type, ...]] = None, /) -> Callable[[F], F]:
     """Define the decorated method as overloading the associated base method.
 
+    The types the method processes are read from the annotation of its
+    argument when it is decorated. The implementations overriding the
+    method in subclasses are registered with these same types.
+
     Args:
         __id (str): the identifier of the associated base method.
         __dt (type, optional): explicitly force the type if needed.
 
     Returns:
-        the same method, overloading the base with the same identifier.
+        the same method, overloading the base with the same identifier,
+            once set in a class.
     """
 
     def _api(method: F) -> F:
-        setattr(method, __api_overload__, (__id, __dt))
-        return method
+        return tag_api(method, __id, __dt)
 
     return _api
 
 
-def _register(
-    base: "singledispatchmethod[Any]",
-    over: Callable[..., Any],
-    types: Optional[Tuple[type, ...]] = None,
-) -> Callable[..., Any]:
-    """Register an overload of the base method with the specified types."""
+def tag_api(__method: F, __id: str, __dt: Optional[Tuple[type, ...]] = None, /) -> F:
+    """Define the method as overloading the associated base method.
+
+    Same as `api` without the intermediate decorator, e.g. in a class body
+    `handler = tag_api(_handler, "l2_api")`.
+
+    Args:
+        __method (Callable): the method overloading the base.
+        __id (str): the identifier of the associated base method.
+        __dt (type, optional): explicitly force the type if needed.
+
+    Returns:
+        the same method, overloading the base with the same identifier,
+            once set in a class.
+    """
+    types = __dt
     if types is None:
-        # register with the annotated types
-        return base.register(over)
+        try:
+            types = _annotated_types(__method)
+        except (NameError, TypeError):
+            # retried upon registration, which reports the error
+            pass
+    return _ApiMethod(__method, __id, types, is_base=False)  # type: ignore
+
 
-    # register with specified types
-    return reduce(lambda o, ty: base.register(ty)(o), types, over)
+def _annotated_types(__method: Callable[..., Any], /) -> Tuple[type, ...]:
+    """Types the argument processed by the method is annotated with."""
+    hints = get_type_hints(__method)
+    hints.pop("return", None)
+    if not hints:
+        raise TypeError(
+            f"Cannot register {__method.__qualname__}: annotate its argument "
+            "or specify the types explicitly."
+        )
+    tp = next(iter(hints.values()))
+    if get_origin(tp) is Union:
+        return get_args(tp)
+    return (tp,)
+
+
+def _register(
+    table: _DispatchTable, over: Callable[..., Any], types: Tuple[type, ...]
+) -> None:
+    """Register an overload of the base method with the specified types."""
+    for ty in types:
+        table[ty] = over
 
 
 def _log(method: F) -> F:
     """Log the call to the method."""
+    if getattr(method, __api_logged__, False):
+        # already wrapped for a parent class
+        return method
+    if (wrapper := getattr(method, __api_log_wrapper__, None)) is not None:
+        # the classes registering the same method share its wrapper
+        return wrapper
+
+    enter_msg = f"Executing {method.__qualname__}"
+    exit_msg = f"Done executing {method.__qualname__}"
 
-    @wraps(method)
+    # the markers stored in the __dict__ of the method are not copied
+    @wraps(method, updated=())
     def __log_processing(self: HasLogger, request: Any) -> Any:
-        self.logger.debug("Executing %s", method.__qualname__)
+        logger = self.logger
+        if debug := logger.isEnabledFor(logging.DEBUG):
+            logger.debug(enter_msg)
         try:
             return method(self, request)
         except Exception as exc:
-            self.logger.info(exc)
+            logger.info(exc)
             raise
         finally:
-            self.logger.debug("Done executing %s", method.__qualname__)
+            if debug:
+                logger.debug(exit_msg)
 
-    return cast(F, __log_processing)
+    setattr(__log_processing, __api_logged__, True)
+    with suppress(AttributeError):
+        setattr(method, __api_log_wrapper__, __log_processing)
+    return __log_processing  # type: ignore
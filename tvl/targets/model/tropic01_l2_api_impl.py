@@ -29,7 +29,7 @@ from ...constants import (
 )
 from ...messages.exceptions import NoValidSubclassError, SubclassNotFoundError
 from ...messages.l2_messages import L2Response
-from ...messages.l3_messages import L3Command, L3EncryptedPacket, L3Result
+from ...messages.l3_messages import L3EncryptedPacket, L3Result
 from .exceptions import (
     L2ProcessingErrorContinue,
     L2ProcessingErrorGeneric,
@@ -139,23 +139,12 @@ class L2APIImplementation(L2API):
             raise L2ProcessingErrorTag("Invalid TAG in encrypted command request")
 
         self.logger.debug("Parsing raw L3 command %s.", req_data)
-        try:
-            command = self.parse_command_fn(
-                L3Command.with_length(len(req_data)).from_bytes(req_data).id.value,
-                req_data,
-            )
-        except SubclassNotFoundError as exc:
-            self.logger.debug(exc)
+        if not req_data:
+            # no ID field to read the command from
+            self.logger.debug("Empty L3 command.")
             result = L3Result(result=L3ResultFieldEnum.INVALID_CMD)
-        except NoValidSubclassError as exc:
-            self.logger.debug(exc)
-            result = L3Result(result=L3ResultFieldEnum.FAIL)
         else:
-            self.logger.info("Processing L3 command %s.", command)
-            try:
-                result = self.process_l3_command(command)
-            except L3ProcessingError as exc:
-                result = L3Result(result=exc.result)
+            result = self._process_raw_l3_command(req_data)
 
         self.logger.info("Encrypting L3 result %s.", result)
         encrypted_result = L3EncryptedPacket.from_encrypted(
@@ -182,6 +171,24 @@ class L2APIImplementation(L2API):
 
         return chunks
 
+    def _process_raw_l3_command(self, req_data: bytes) -> L3Result:
+        """Parse and process a decrypted, non-empty L3 command."""
+        try:
+            # the ID field is the first byte of the command
+            command = self.parse_command_fn(req_data[0], req_data)
+        except SubclassNotFoundError as exc:
+            self.logger.debug(exc)
+            return L3Result(result=L3ResultFieldEnum.INVALID_CMD)
+        except NoValidSubclassError as exc:
+            self.logger.debug(exc)
+            return L3Result(result=L3ResultFieldEnum.FAIL)
+
+        self.logger.info("Processing L3 command %s.", command)
+        try:
+            return self.process_l3_command(command)
+        except L3ProcessingError as exc:
+            return L3Result(result=exc.result)
+
     def ts_l2_encrypted_session_abt(
         self, request: TsL2EncryptedSessionAbtRequest
     ) -> TsL2EncryptedSessionAbtResponse:
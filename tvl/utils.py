@@ -20,7 +20,9 @@ def split_data(data: bytes, *, chunk_size: int) -> Iterator[bytes]:
     Yields:
         the chunks
     """
-    yield from map(bytes, chunked(data, chunk_size))
+    data = bytes(data)
+    for i in range(0, len(data), chunk_size):
+        yield data[i : i + chunk_size]
 
 
 def iter_subclasses(__cls: Type[T], /) -> Iterator[Type[T]]: